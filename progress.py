@@ -5,18 +5,281 @@ Progress Tracking Utilities
 Functions for tracking and displaying progress of the autonomous coding agent.
 """
 
-import json
+import atexit
+import base64
+import http.client
 import os
-import urllib.request
+import queue
+import sys
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
+# Prefer a C-accelerated JSON library when installed; feature_list.json can
+# grow large, and it is parsed on every progress summary once it changes.
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    try:
+        import ujson as _json
+    except ImportError:
+        import json as _json
+
+    _loads = _json.loads
+
+    def _dumps(obj) -> bytes:
+        return _json.dumps(obj).encode('utf-8')
+
+# With ijson installed, feature_list.json is streamed one feature at a time
+# instead of being materialized as a whole
+try:
+    import ijson
+
+    _PARSE_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _PARSE_ERRORS = (ValueError,)
 
 WEBHOOK_URL = os.environ.get("PROGRESS_N8N_WEBHOOK_URL")
 TELEGRAM_BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN")
 TELEGRAM_CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID")
 PROGRESS_CACHE_FILE = ".progress_cache"
+FEATURE_FIELDS = ("passes", "description", "category")  # Fields progress tracking reads
 TELEGRAM_MILESTONE_INTERVAL = 10  # Notify every N completed features
+NOTIFY_QUEUE_MAXSIZE = 100  # Drop notifications beyond this backlog
+NOTIFY_CONNECT_TIMEOUT = 2
+NOTIFY_READ_TIMEOUT = 5
+NOTIFY_EXIT_TIMEOUT = 10  # Max seconds to wait for pending sends at exit
+CACHE_FLUSH_INTERVAL = 5.0  # Min seconds between progress cache writes
+MAX_CACHED_FEATURES = 1_000_000  # Sanity bound on feature indices read from the cache
+_BAR = "=" * 70
+
+# Telegram settings are fixed for the life of the process, so derive them once
+_TELEGRAM_URL = (
+    f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+    if TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID
+    else None
+)
+_TG_BASE = {"chat_id": TELEGRAM_CHAT_ID, "parse_mode": "HTML"}
+
+# Notifications are POSTed from a background worker so progress reporting
+# never blocks on the network. Connections are kept open per host.
+_notify_queue: queue.Queue = queue.Queue(maxsize=NOTIFY_QUEUE_MAXSIZE)
+_notify_worker: threading.Thread | None = None
+_notify_lock = threading.Lock()
+_connections: dict[tuple[str, str, int | None], http.client.HTTPConnection] = {}
+# Progress webhook payload waiting in the queue; later progress merges into it
+_pending_webhook: dict | None = None
+
+# Parsed feature_list.json contents keyed by path:
+# (mtime_ns, size, features, passing_bits)
+_feature_cache: dict[str, tuple[int, int, list, int]] = {}
+
+# Last known (count, passing_bits) per progress cache file. The file itself is
+# only read the first time a project is seen; after that this is authoritative.
+_progress_state: dict[Path, tuple[int, int]] = {}
+# (count, passing_bits) not yet written to disk, and when each file was last written
+_dirty_cache: dict[Path, tuple[int, int]] = {}
+_last_flush: dict[Path, float] = {}
+# Bytes last read from or written to each progress cache file
+_last_written: dict[Path, bytes] = {}
+# Passing count seen by the last send_progress_webhook call per project
+_last_passing: dict[Path, int] = {}
+
+# "[category] " notification prefixes, built once per distinct category
+_category_prefixes: dict[str, str] = {}
+
+
+def _parse_target(url: str) -> tuple[str, str, int | None, str]:
+    """
+    Split a URL into (scheme, host, port, request path) for _post_json.
+
+    Raises:
+        ValueError: If the URL is malformed or has no hostname
+    """
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError("expected an http(s) URL with a hostname")
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    return parts.scheme, parts.hostname, parts.port, path
+
+
+def _notify_target(label: str, url: str | None) -> tuple[str, str, int | None, str] | None:
+    """Parse a notifier URL, disabling that notifier (with a warning) if it is invalid."""
+    if not url:
+        return None
+    try:
+        return _parse_target(url)
+    except ValueError as e:
+        print(f"[{label} notifications disabled: invalid URL: {e}]")
+        return None
+
+
+# Destinations are fixed for the life of the process, so parse them once
+_TELEGRAM_TARGET = _notify_target("Telegram", _TELEGRAM_URL)
+_TELEGRAM_ENABLED = _TELEGRAM_TARGET is not None
+_WEBHOOK_TARGET = _notify_target("Webhook", WEBHOOK_URL)
+_POST_HEADERS = {"Content-Type": "application/json", "Connection": "keep-alive"}
+_NOTIFY_ENABLED = _TELEGRAM_ENABLED or _WEBHOOK_TARGET is not None
+
+
+def _get_connection(key: tuple[str, str, int | None]) -> http.client.HTTPConnection:
+    """Return the kept-alive connection for (scheme, host, port), creating it if needed."""
+    conn = _connections.get(key)
+    if conn is None:
+        scheme, host, port = key
+        conn_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = conn_class(host, port, timeout=NOTIFY_CONNECT_TIMEOUT)
+        _connections[key] = conn
+    return conn
+
+
+def _drop_connection(key: tuple[str, str, int | None]) -> None:
+    """Close and forget a connection so the next request reconnects."""
+    conn = _connections.pop(key, None)
+    if conn is not None:
+        conn.close()
+
+
+def _post_json(target: tuple[str, str, int | None, str], body: bytes) -> None:
+    """
+    POST a JSON body, reusing the kept-alive connection for the target host.
+
+    Args:
+        target: (scheme, host, port, path) from _parse_target
+        body: Encoded JSON request body
+    """
+    scheme, host, port, path = target
+    key = (scheme, host, port)
+
+    for attempt in range(2):
+        conn = _get_connection(key)
+        reused = conn.sock is not None
+        try:
+            conn.request("POST", path, body=body, headers=_POST_HEADERS)
+            # Connect timeout applies to the handshake; allow longer for the reply
+            conn.sock.settimeout(NOTIFY_READ_TIMEOUT)
+            response = conn.getresponse()
+            response.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            _drop_connection(key)
+            # The server may have closed an idle kept-alive connection; retry once fresh
+            if reused and attempt == 0:
+                continue
+            raise
+        except Exception:
+            _drop_connection(key)
+            raise
+
+        if response.status >= 400:
+            raise http.client.HTTPException(f"HTTP {response.status} {response.reason}")
+        return
+
+
+def _drain_notifications() -> None:
+    """Worker loop: send queued notifications until a None sentinel arrives."""
+    while True:
+        item = _notify_queue.get()
+        try:
+            if item is None:
+                return
+            label, target, body = item
+            try:
+                if body is None:
+                    body = _take_pending_webhook()
+                _post_json(target, body)
+            except Exception as e:
+                print(f"[{label} notification failed: {e}]")
+        finally:
+            _notify_queue.task_done()
+
+
+def _stop_notify_worker() -> None:
+    """Let the worker finish pending sends (bounded) before the process exits."""
+    if _notify_worker is None:
+        return
+    try:
+        _notify_queue.put(None, timeout=NOTIFY_EXIT_TIMEOUT)
+    except queue.Full:
+        return
+    _notify_worker.join(timeout=NOTIFY_EXIT_TIMEOUT)
+
+
+def _enqueue_notification(label: str, target: tuple[str, str, int | None, str], body: bytes | None) -> bool:
+    """
+    Queue a JSON POST for the background worker.
+
+    Args:
+        label: Name used in failure messages (e.g. "Telegram")
+        target: Destination from _parse_target
+        body: Encoded JSON request body, or None to send the pending progress webhook
+
+    Returns:
+        True if queued, False if the queue is full
+    """
+    global _notify_worker
+
+    with _notify_lock:
+        if _notify_worker is None:
+            _notify_worker = threading.Thread(target=_drain_notifications, name="progress-notify", daemon=True)
+            _notify_worker.start()
+            atexit.register(_stop_notify_worker)
+
+    try:
+        _notify_queue.put_nowait((label, target, body))
+        return True
+    except queue.Full:
+        print(f"[{label} notification dropped: send queue full]")
+        return False
+
+
+def _take_pending_webhook() -> bytes:
+    """Claim the pending progress webhook payload and encode it for sending."""
+    global _pending_webhook
+
+    with _notify_lock:
+        payload, _pending_webhook = _pending_webhook, None
+
+    return _dumps([payload])  # n8n expects array
+
+
+def _queue_progress_webhook(payload: dict) -> None:
+    """
+    Queue a progress webhook, coalescing with one that has not been sent yet.
+
+    If an earlier payload is still waiting in the queue, it is updated to the
+    latest progress and its completed_tests are extended, so a slow endpoint
+    receives one POST covering every update since the last send.
+
+    Args:
+        payload: Webhook payload for the current progress
+    """
+    global _pending_webhook
+
+    with _notify_lock:
+        pending = _pending_webhook
+        if pending is not None:
+            previous = pending["previous_passing"]
+            merged_tests = pending["completed_tests"] + payload["completed_tests"]
+            pending.update(payload)
+            pending["previous_passing"] = previous
+            pending["tests_completed_this_session"] = pending["passing"] - previous
+            pending["completed_tests"] = merged_tests
+            return
+        _pending_webhook = payload
+
+    if not _enqueue_notification("Webhook", _WEBHOOK_TARGET, None):
+        with _notify_lock:
+            _pending_webhook = None
 
 
 def send_telegram_notification(message: str) -> bool:
@@ -27,29 +290,14 @@ def send_telegram_notification(message: str) -> bool:
         message: The message to send
 
     Returns:
-        True if sent successfully, False otherwise
+        True if queued for sending, False otherwise
     """
-    if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
+    if not _TELEGRAM_ENABLED:
         return False
 
-    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-    payload = {
-        "chat_id": TELEGRAM_CHAT_ID,
-        "text": message,
-        "parse_mode": "HTML"
-    }
+    payload = {**_TG_BASE, "text": message}
 
-    try:
-        req = urllib.request.Request(
-            url,
-            data=json.dumps(payload).encode('utf-8'),
-            headers={'Content-Type': 'application/json'}
-        )
-        urllib.request.urlopen(req, timeout=10)
-        return True
-    except Exception as e:
-        print(f"[Telegram notification failed: {e}]")
-        return False
+    return _enqueue_notification("Telegram", _TELEGRAM_TARGET, _dumps(payload))
 
 
 def check_telegram_milestone(passing: int, previous: int, total: int, project_dir: Path, completed_tests: list) -> None:
@@ -63,7 +311,7 @@ def check_telegram_milestone(passing: int, previous: int, total: int, project_di
         project_dir: Project directory name
         completed_tests: List of newly completed test descriptions
     """
-    if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
+    if not _TELEGRAM_ENABLED:
         return
 
     # Calculate which milestones we've crossed
@@ -75,72 +323,83 @@ def check_telegram_milestone(passing: int, previous: int, total: int, project_di
         percentage = round((passing / total) * 100, 1) if total > 0 else 0
 
         # Build the message
-        message = (
-            f"🎯 <b>Milestone Reached!</b>\n\n"
-            f"📊 <b>Project:</b> {project_dir.name}\n"
-            f"✅ <b>Progress:</b> {passing}/{total} tests ({percentage}%)\n"
-            f"🏆 <b>Milestone:</b> {current_milestone} features completed!\n\n"
-        )
+        parts = [
+            "🎯 <b>Milestone Reached!</b>\n\n",
+            f"📊 <b>Project:</b> {project_dir.name}\n",
+            f"✅ <b>Progress:</b> {passing}/{total} tests ({percentage}%)\n",
+            f"🏆 <b>Milestone:</b> {current_milestone} features completed!\n\n",
+        ]
 
         # Add recently completed tests (last 5 max to keep message short)
         if completed_tests:
-            recent = completed_tests[-5:] if len(completed_tests) > 5 else completed_tests
-            message += "📝 <b>Recently completed:</b>\n"
-            for test in recent:
-                # Truncate long descriptions
-                desc = test[:60] + "..." if len(test) > 60 else test
-                message += f"  • {desc}\n"
+            parts.append("📝 <b>Recently completed:</b>\n")
+            # Truncate long descriptions
+            parts.extend(
+                f"  • {test if len(test) <= 60 else test[:60] + '...'}\n"
+                for test in completed_tests[-5:]
+            )
 
-        message += f"\n⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        parts.append(f"\n⏰ {now}")
+        message = "".join(parts)
 
         send_telegram_notification(message)
 
 
-def send_progress_webhook(passing: int, total: int, project_dir: Path) -> None:
-    """Send webhook notification and Telegram milestone alerts when progress increases."""
+def send_progress_webhook(
+    passing: int,
+    total: int,
+    project_dir: Path,
+    tests: list | None = None,
+    passing_bits: int | None = None,
+    previous_progress: tuple[int, int] | None = None,
+) -> None:
+    """
+    Send webhook notification and Telegram milestone alerts when progress increases.
+
+    Args:
+        passing: Current number of passing tests
+        total: Total number of tests
+        project_dir: Directory containing feature_list.json
+        tests: Already-parsed feature list, loaded from disk if omitted
+        passing_bits: Bitmask of passing features in tests (bit i = feature i)
+        previous_progress: Already-read (count, passing_bits) from the progress cache
+    """
+    # Same count as last time: nothing to notify and nothing new to record
+    if _last_passing.get(project_dir) == passing:
+        return
+
     cache_file = project_dir / PROGRESS_CACHE_FILE
-    previous = 0
-    previous_passing_tests = set()
 
-    # Read previous progress and passing test indices
-    if cache_file.exists():
-        try:
-            cache_data = json.loads(cache_file.read_text())
-            previous = cache_data.get("count", 0)
-            previous_passing_tests = set(cache_data.get("passing_indices", []))
-        except:
-            previous = 0
+    if tests is None:
+        tests, passing_bits = _load_features(project_dir / "feature_list.json")
+    elif passing_bits is None:
+        passing_bits = _find_passing(tests)
+
+    if previous_progress is None:
+        previous_progress = _read_progress_cache(cache_file)
+    previous, previous_bits = previous_progress
+
+    # Nothing to notify: just keep the cache's high-water mark current so that
+    # enabling a notifier later doesn't report already-passing tests as new
+    if not _NOTIFY_ENABLED:
+        if passing > previous or (cache_file not in _last_written and cache_file not in _dirty_cache):
+            _mark_dirty(cache_file, passing, passing_bits)
+        elif passing < previous:
+            _flush_cache(cache_file)
+        _last_passing[project_dir] = passing
+        return
 
     # Only notify if progress increased
     if passing > previous:
         # Find which tests are now passing
-        tests_file = project_dir / "feature_list.json"
-        completed_tests = []
-        current_passing_indices = []
-
-        if tests_file.exists():
-            try:
-                with open(tests_file, "r") as f:
-                    tests = json.load(f)
-                for i, test in enumerate(tests):
-                    if test.get("passes", False):
-                        current_passing_indices.append(i)
-                        if i not in previous_passing_tests:
-                            # This test is newly passing
-                            desc = test.get("description", f"Test #{i+1}")
-                            category = test.get("category", "")
-                            if category:
-                                completed_tests.append(f"[{category}] {desc}")
-                            else:
-                                completed_tests.append(desc)
-            except:
-                pass
+        completed_tests = [_format_test(i, tests[i]) for i in _iter_bits(passing_bits & ~previous_bits)]
 
         # Send Telegram notification if milestone reached (every 10 features)
         check_telegram_milestone(passing, previous, total, project_dir, completed_tests)
 
         # Send n8n webhook if configured
-        if WEBHOOK_URL:
+        if _WEBHOOK_TARGET is not None:
             payload = {
                 "event": "test_progress",
                 "passing": passing,
@@ -153,93 +412,329 @@ def send_progress_webhook(passing: int, total: int, project_dir: Path) -> None:
                 "timestamp": datetime.utcnow().isoformat() + "Z"
             }
 
-            try:
-                req = urllib.request.Request(
-                    WEBHOOK_URL,
-                    data=json.dumps([payload]).encode('utf-8'),  # n8n expects array
-                    headers={'Content-Type': 'application/json'}
-                )
-                urllib.request.urlopen(req, timeout=5)
-            except Exception as e:
-                print(f"[Webhook notification failed: {e}]")
+            _queue_progress_webhook(payload)
 
-        # Update cache with count and passing indices
-        cache_file.write_text(json.dumps({
-            "count": passing,
-            "passing_indices": current_passing_indices
-        }))
+        # Update cache with count and passing tests
+        _mark_dirty(cache_file, passing, passing_bits)
     else:
+        # Persist the high-water mark right away if progress went backwards
+        if passing < previous:
+            _flush_cache(cache_file)
+
         # Update cache even if no change (for initial state)
-        if not cache_file.exists():
-            tests_file = project_dir / "feature_list.json"
-            current_passing_indices = []
-            if tests_file.exists():
-                try:
-                    with open(tests_file, "r") as f:
-                        tests = json.load(f)
-                    for i, test in enumerate(tests):
-                        if test.get("passes", False):
-                            current_passing_indices.append(i)
-                except:
-                    pass
-            cache_file.write_text(json.dumps({
-                "count": passing,
-                "passing_indices": current_passing_indices
-            }))
+        if cache_file not in _last_written and cache_file not in _dirty_cache:
+            _mark_dirty(cache_file, passing, passing_bits)
 
+    _last_passing[project_dir] = passing
 
-def count_passing_tests(project_dir: Path) -> tuple[int, int]:
+
+def _read_progress_cache(cache_file: Path) -> tuple[int, int]:
     """
-    Count passing and total tests in feature_list.json.
+    Return previous progress, reading the cache file only on first use.
 
     Args:
-        project_dir: Directory containing feature_list.json
+        cache_file: Path to the progress cache file
 
     Returns:
-        (passing_count, total_count)
+        (count, passing_bits), zeros if there is no usable cache
     """
-    tests_file = project_dir / "feature_list.json"
+    progress = _progress_state.get(cache_file)
+    if progress is None:
+        progress = _progress_state[cache_file] = _read_progress_file(cache_file)
+    return progress
 
-    if not tests_file.exists():
+
+def _read_progress_file(cache_file: Path) -> tuple[int, int]:
+    """Read (count, passing_bits) from the progress cache file, zeros if unusable."""
+    # Read directly rather than checking exists() first: one syscall fewer,
+    # and a missing file is just another OSError
+    try:
+        raw = cache_file.read_bytes()
+    except OSError:
+        return 0, 0
+
+    # An empty cache holds no progress; skip the parse entirely
+    if not raw:
         return 0, 0
 
     try:
-        with open(tests_file, "r") as f:
-            data = json.load(f)
+        progress = _parse_cache(_loads(raw))
+    except ValueError:
+        return 0, 0
+
+    _last_written[cache_file] = raw
+    return progress
+
+
+def _mark_dirty(cache_file: Path, count: int, bits: int) -> None:
+    """
+    Record new progress, writing the cache file at most every CACHE_FLUSH_INTERVAL.
+
+    Args:
+        cache_file: Path to the progress cache file
+        count: Number of passing tests
+        bits: Bitmask of passing tests
+    """
+    _progress_state[cache_file] = _dirty_cache[cache_file] = (count, bits)
+
+    last = _last_flush.get(cache_file)
+    if last is None or time.monotonic() - last > CACHE_FLUSH_INTERVAL:
+        _flush_cache(cache_file)
+
+
+def _flush_cache(cache_file: Path) -> None:
+    """Write pending progress cache contents for cache_file, if any and changed."""
+    progress = _dirty_cache.pop(cache_file, None)
+    if progress is None:
+        return
+
+    data = _dumps(_cache_contents(*progress))
+    if _last_written.get(cache_file) == data:
+        return
+
+    cache_file.write_bytes(data)
+    _last_written[cache_file] = data
+    _last_flush[cache_file] = time.monotonic()
+
+
+def _flush_all() -> None:
+    """Write all pending progress cache contents (run at exit)."""
+    for cache_file in list(_dirty_cache):
+        _flush_cache(cache_file)
+
+
+atexit.register(_flush_all)
+
+
+def _format_test(index: int, test: dict) -> str:
+    """Format a feature as "[category] description" for notifications."""
+    desc = test.get("description", f"Test #{index+1}")
+    category = test.get("category", "")
+    if not category:
+        return desc
+    if not isinstance(category, str):
+        return f"[{category}] {desc}"
+
+    prefix = _category_prefixes.get(category)
+    if prefix is None:
+        prefix = _category_prefixes[category] = f"[{category}] "
+    return f"{prefix}{desc}"
+
+
+def _indices_to_bits(indices: list[int]) -> int:
+    """
+    Pack feature indices into a bitmask (bit i set = feature i).
+
+    Raises:
+        ValueError: If an entry is not a non-negative int
+    """
+    if not indices:
+        return 0
+    for i in indices:
+        if type(i) is not int or i < 0:
+            raise ValueError(f"invalid feature index: {i!r}")
+    packed = bytearray(max(indices) // 8 + 1)
+    for i in indices:
+        packed[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(packed, "little")
+
+
+def _iter_bits(bits: int) -> Iterator[int]:
+    """Yield the indices of set bits, lowest first."""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+def _find_passing(tests: list) -> int:
+    """Return a bitmask of passing features."""
+    return _indices_to_bits([
+        i for i, test in enumerate(tests) if isinstance(test, dict) and test.get("passes", False)
+    ])
+
+
+def _cache_contents(count: int, bits: int) -> dict:
+    """Build progress cache contents, storing passing features as a base64 bitset."""
+    packed = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    return {"count": count, "passing_bits": base64.b64encode(packed).decode("ascii")}
+
+
+def _parse_cache(cache_data: dict) -> tuple[int, int]:
+    """
+    Read progress cache contents.
+
+    Accepts both the bitset format and the older "passing_indices" list.
+
+    Args:
+        cache_data: Decoded progress cache contents
+
+    Returns:
+        (count, passing_bits)
+
+    Raises:
+        ValueError: If the contents are malformed
+    """
+    if not isinstance(cache_data, dict):
+        raise ValueError("progress cache is not a JSON object")
+
+    count = cache_data.get("count", 0)
+    if type(count) is not int or count < 0:
+        raise ValueError(f"invalid progress count: {count!r}")
+
+    if "passing_bits" in cache_data:
+        encoded = cache_data["passing_bits"]
+        if not isinstance(encoded, str) or len(encoded) > MAX_CACHED_FEATURES // 6 + 4:
+            raise ValueError("invalid passing_bits")
+        # validate=True makes bad base64 raise binascii.Error (a ValueError)
+        bits = int.from_bytes(base64.b64decode(encoded, validate=True), "little")
+    else:
+        indices = cache_data.get("passing_indices", [])
+        if not isinstance(indices, list):
+            raise ValueError("invalid passing_indices")
+        if any(type(i) is int and i >= MAX_CACHED_FEATURES for i in indices):
+            raise ValueError("passing_indices entry out of range")
+        bits = _indices_to_bits(indices)
+    return count, bits
+
+
+def _parse_features(f) -> list:
+    """
+    Parse an open feature_list.json, keeping only FEATURE_FIELDS of each feature.
+
+    Non-dict entries are kept as None so indices and the total stay aligned
+    with the file.
+
+    Args:
+        f: feature_list.json opened in binary mode
+
+    Returns:
+        List of trimmed features
+    """
+    if ijson is not None:
+        # Handle both flat array and wrapped object formats
+        start = f.read(1)
+        while start.isspace():
+            start = f.read(1)
+        f.seek(0)
+        # use_float: return floats like orjson/json, not Decimal (which _dumps can't encode)
+        if start == b"[":
+            items = ijson.items(f, "item", use_float=True)
+        elif start == b"{":
+            items = ijson.items(f, "features.item", use_float=True)
+        else:
+            items = ()
+    else:
+        data = _loads(f.read())
 
         # Handle both flat array and wrapped object formats
         if isinstance(data, list):
-            tests = data
+            items = data
         elif isinstance(data, dict) and "features" in data:
-            tests = data["features"]
+            items = data["features"]
         else:
-            tests = []
+            items = ()
 
-        total = len(tests)
-        passing = sum(1 for test in tests if isinstance(test, dict) and test.get("passes", False))
+    return [_trim_feature(test) for test in items]
 
-        return passing, total
-    except (json.JSONDecodeError, IOError):
-        return 0, 0
+
+def _trim_feature(test) -> dict | None:
+    """Keep only FEATURE_FIELDS of a feature, or None if it isn't an object."""
+    if not isinstance(test, dict):
+        return None
+
+    trimmed = {field: test[field] for field in FEATURE_FIELDS if field in test}
+    category = trimmed.get("category")
+    if isinstance(category, str):
+        # Features share a handful of categories; keep one string per category
+        trimmed["category"] = sys.intern(category)
+    return trimmed
+
+
+def _load_features(tests_file: Path) -> tuple[list, int]:
+    """
+    Load the feature list, reusing the previous parse while the file is unchanged.
+
+    Args:
+        tests_file: Path to feature_list.json
+
+    Returns:
+        (features, passing_bits), both empty if the file is missing or invalid
+    """
+    key = str(tests_file)
+
+    try:
+        stat = os.stat(tests_file)
+    except OSError:
+        _feature_cache.pop(key, None)
+        return [], 0
+
+    cached = _feature_cache.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2], cached[3]
+
+    # An empty file (e.g. mid-write) has no features; don't take the parse-error path
+    if stat.st_size == 0:
+        _feature_cache.pop(key, None)
+        return [], 0
+
+    try:
+        with open(tests_file, "rb") as f:
+            tests = _parse_features(f)
+    except (*_PARSE_ERRORS, OSError):
+        _feature_cache.pop(key, None)
+        return [], 0
+
+    passing_bits = _find_passing(tests)
+    _feature_cache[key] = (stat.st_mtime_ns, stat.st_size, tests, passing_bits)
+    return tests, passing_bits
+
+
+def count_passing_tests(project_dir: Path) -> tuple[int, int]:
+    """
+    Count passing and total tests in feature_list.json.
+
+    Args:
+        project_dir: Directory containing feature_list.json
+
+    Returns:
+        (passing_count, total_count)
+    """
+    tests, passing_bits = _load_features(project_dir / "feature_list.json")
+
+    return passing_bits.bit_count(), len(tests)
 
 
 def print_session_header(session_num: int, is_initializer: bool) -> None:
     """Print a formatted header for the session."""
     session_type = "INITIALIZER" if is_initializer else "CODING AGENT"
 
-    print("\n" + "=" * 70)
-    print(f"  SESSION {session_num}: {session_type}")
-    print("=" * 70)
-    print()
+    # One write so the banner can't interleave with notifier output
+    sys.stdout.write(f"\n{_BAR}\n  SESSION {session_num}: {session_type}\n{_BAR}\n\n")
 
 
 def print_progress_summary(project_dir: Path) -> None:
     """Print a summary of current progress."""
-    passing, total = count_passing_tests(project_dir)
+    tests_file = project_dir / "feature_list.json"
+    cache_file = project_dir / PROGRESS_CACHE_FILE
+    previous_progress = None
+
+    if cache_file not in _progress_state:
+        # First look at this project: both files come from disk, so overlap the
+        # reads (matters on network filesystems)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            features = pool.submit(_load_features, tests_file)
+            cached = pool.submit(_read_progress_cache, cache_file)
+        tests, passing_bits = features.result()
+        previous_progress = cached.result()
+    else:
+        tests, passing_bits = _load_features(tests_file)
+
+    passing, total = passing_bits.bit_count(), len(tests)
 
     if total > 0:
         percentage = (passing / total) * 100
         print(f"\nProgress: {passing}/{total} tests passing ({percentage:.1f}%)")
-        send_progress_webhook(passing, total, project_dir)
+        send_progress_webhook(passing, total, project_dir, tests, passing_bits, previous_progress)
     else:
         print("\nProgress: feature_list.json not yet created")
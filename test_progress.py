@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+"""
+Progress Tracking Tests
+=======================
+
+Tests for progress cache parsing, feature list handling and notifications.
+Run with: python test_progress.py
+"""
+
+import http.server
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Notifiers are configured per test below; keep the environment from enabling them
+for var in ("PROGRESS_N8N_WEBHOOK_URL", "TELEGRAM_BOT_TOKEN", "TELEGRAM_CHAT_ID"):
+    os.environ.pop(var, None)
+
+import progress
+
+
+def check(description: str, ok: bool, detail: str = "") -> bool:
+    """Print a PASS/FAIL line for a single check."""
+    if ok:
+        print(f"  PASS: {description}")
+        return True
+
+    print(f"  FAIL: {description}")
+    if detail:
+        print(f"         {detail}")
+    return False
+
+
+class WebhookServer:
+    """Local HTTP server that records webhook payloads and can hold requests."""
+
+    def __init__(self):
+        self.payloads = []
+        self.received = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                server.payloads.append(json.loads(body))
+                server.received.set()
+                server.release.wait(10)
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/hook"
+
+    def wait_for(self, count: int) -> None:
+        """Wait (bounded) until the notification queue is drained and count payloads arrived."""
+        wait_for_queue()
+        if len(self.payloads) < count:
+            self.received.wait(5)
+
+
+def wait_for_queue(timeout: float = 5) -> None:
+    """Wait until the notification worker has handled every queued item, or timeout."""
+    deadline = time.monotonic() + timeout
+    while progress._notify_queue.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def enable_webhook(url: str) -> None:
+    """Point the progress module's webhook notifier at url."""
+    progress._WEBHOOK_TARGET = progress._parse_target(url)
+    progress._NOTIFY_ENABLED = True
+
+
+def disable_notifiers() -> None:
+    """Restore the no-notifier configuration."""
+    progress._WEBHOOK_TARGET = None
+    progress._NOTIFY_ENABLED = progress._TELEGRAM_ENABLED
+
+
+_mtime_bump = 0
+
+
+def write_features(project_dir: Path, features: list) -> None:
+    """Write feature_list.json, forcing a new mtime so the parse cache sees the change."""
+    global _mtime_bump
+
+    tests_file = project_dir / "feature_list.json"
+    tests_file.write_text(json.dumps(features))
+    _mtime_bump += 1_000_000
+    stat = os.stat(tests_file)
+    os.utime(tests_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + _mtime_bump))
+
+
+def make_features(count: int, passing: int) -> list:
+    """Build count features in three categories, the first passing of them passing."""
+    return [
+        {"category": f"c{i % 3}", "description": f"feature {i}", "steps": ["step"], "passes": i < passing}
+        for i in range(count)
+    ]
+
+
+def read_cache_bytes(content: bytes) -> tuple[int, int]:
+    """Write content to a fresh progress cache file and read it back."""
+    cache_file = Path(tempfile.mkdtemp()) / progress.PROGRESS_CACHE_FILE
+    cache_file.write_bytes(content)
+    return progress._read_progress_file(cache_file)
+
+
+def test_legacy_cache():
+    """Test reading caches in the older passing_indices format."""
+    print("\nTesting legacy passing_indices caches:\n")
+    passed = 0
+    failed = 0
+
+    # Test cases: (cache contents, expected (count, bits), description)
+    test_cases = [
+        ({"count": 3, "passing_indices": [0, 2, 9]}, (3, 0b1000000101), "valid indices"),
+        ({"count": 0, "passing_indices": []}, (0, 0), "no passing tests"),
+        ({"count": 1}, (1, 0), "missing passing_indices"),
+        # Corrupt caches fall back to zeros instead of raising
+        ({"count": 1, "passing_indices": [-1]}, (0, 0), "negative index"),
+        ({"count": 2, "passing_indices": [0, -3]}, (0, 0), "negative index mixed with valid"),
+        ({"count": 1, "passing_indices": ["a"]}, (0, 0), "non-int index"),
+        ({"count": 1, "passing_indices": [True]}, (0, 0), "bool index"),
+        ({"count": 1, "passing_indices": 5}, (0, 0), "passing_indices not a list"),
+        ({"count": 1, "passing_indices": [10 ** 12]}, (0, 0), "huge index"),
+        ({"count": "x", "passing_indices": [0]}, (0, 0), "non-int count"),
+        ({"count": -1, "passing_indices": []}, (0, 0), "negative count"),
+        ([1, 2], (0, 0), "not an object"),
+    ]
+
+    for cache_data, expected, description in test_cases:
+        try:
+            result = read_cache_bytes(json.dumps(cache_data).encode())
+        except Exception as e:
+            result = f"raised {type(e).__name__}: {e}"
+        if check(description, result == expected, f"Expected: {expected}, Got: {result}"):
+            passed += 1
+        else:
+            failed += 1
+
+    # Undecodable content
+    for content, description in [(b"", "empty file"), (b"{bad", "invalid JSON")]:
+        result = read_cache_bytes(content)
+        if check(description, result == (0, 0), f"Got: {result}"):
+            passed += 1
+        else:
+            failed += 1
+
+    return passed, failed
+
+
+def test_bitset_roundtrip():
+    """Test packing passing features into the base64 bitset cache format."""
+    print("\nTesting passing bitset round-trip:\n")
+    passed = 0
+    failed = 0
+
+    for indices in ([], [0], [7, 8], [0, 2, 9], list(range(0, 200, 3)), [1023]):
+        bits = progress._indices_to_bits(indices)
+        contents = progress._cache_contents(len(indices), bits)
+        parsed = progress._parse_cache(json.loads(json.dumps(contents)))
+        ok = parsed == (len(indices), bits) and list(progress._iter_bits(bits)) == indices
+        if check(f"indices {indices[:5]}{'...' if len(indices) > 5 else ''}", ok, f"Got: {parsed}"):
+            passed += 1
+        else:
+            failed += 1
+
+    # A legacy cache is rewritten in the bitset format on the next update
+    project_dir = Path(tempfile.mkdtemp())
+    cache_file = project_dir / progress.PROGRESS_CACHE_FILE
+    cache_file.write_text(json.dumps({"count": 1, "passing_indices": [0]}))
+    write_features(project_dir, make_features(4, 2))
+    server = WebhookServer()
+    enable_webhook(server.url)
+    try:
+        progress.print_progress_summary(project_dir)
+        progress._flush_all()
+        server.wait_for(1)
+    finally:
+        disable_notifiers()
+    contents = json.loads(cache_file.read_text())
+    ok = contents == {"count": 2, "passing_bits": "Aw=="}
+    if check("legacy cache migrated to passing_bits", ok, f"Got: {contents}"):
+        passed += 1
+    else:
+        failed += 1
+    completed = server.payloads[0][0]["completed_tests"] if server.payloads else None
+    if check("only the newly passing test is reported", completed == ["[c1] feature 1"], f"Got: {completed}"):
+        passed += 1
+    else:
+        failed += 1
+
+    return passed, failed
+
+
+def test_feature_formats():
+    """Test flat and wrapped feature lists, with and without ijson."""
+    print("\nTesting feature list formats:\n")
+    passed = 0
+    failed = 0
+
+    parsers = [("json", None)]
+    if progress.ijson is not None:
+        parsers.append(("ijson", progress.ijson))
+    else:
+        print("  SKIP: ijson not installed, streaming parser not tested")
+
+    features = [
+        {"category": "ui", "description": "a", "steps": ["x"], "passes": True},
+        "not a feature",
+        {"description": "b", "passes": False},
+        {"category": "api", "passes": True},
+    ]
+    # Test cases: (file contents, expected (passing, total), description)
+    test_cases = [
+        (json.dumps(features), (2, 4), "flat array"),
+        ("  \n" + json.dumps({"features": features}), (2, 4), "wrapped object"),
+        (json.dumps({"other": []}), (0, 0), "object without features"),
+        ("", (0, 0), "empty file"),
+        ("[{\"passes\": tr", (0, 0), "truncated JSON"),
+    ]
+
+    saved = progress.ijson
+    try:
+        for name, module in parsers:
+            progress.ijson = module
+            for content, expected, description in test_cases:
+                project_dir = Path(tempfile.mkdtemp())
+                (project_dir / "feature_list.json").write_text(content)
+                result = progress.count_passing_tests(project_dir)
+                if check(f"{name}: {description}", result == expected, f"Expected: {expected}, Got: {result}"):
+                    passed += 1
+                else:
+                    failed += 1
+
+            # Only the tracked fields are kept; indices stay aligned with the file
+            project_dir = Path(tempfile.mkdtemp())
+            (project_dir / "feature_list.json").write_text(json.dumps(features))
+            tests, bits = progress._load_features(project_dir / "feature_list.json")
+            ok = tests[0] == {"category": "ui", "description": "a", "passes": True} and tests[1] is None
+            if check(f"{name}: features trimmed to tracked fields", ok, f"Got: {tests}"):
+                passed += 1
+            else:
+                failed += 1
+
+            # Numbers come back as the same types (float, not Decimal) from every parser
+            project_dir = Path(tempfile.mkdtemp())
+            (project_dir / "feature_list.json").write_text(json.dumps([{"description": 1.5, "passes": True}]))
+            tests, bits = progress._load_features(project_dir / "feature_list.json")
+            description = tests[0]["description"]
+            try:
+                encoded = progress._dumps([progress._format_test(0, tests[0])])
+            except Exception as e:
+                encoded = f"raised {type(e).__name__}: {e}"
+            ok = type(description) is float and encoded == progress._dumps([1.5])
+            if check(f"{name}: numeric description parsed as float", ok, f"Got: {description!r}, {encoded!r}"):
+                passed += 1
+            else:
+                failed += 1
+    finally:
+        progress.ijson = saved
+
+    return passed, failed
+
+
+def test_webhook_coalescing():
+    """Test that progress queued behind a slow send is merged into one POST."""
+    print("\nTesting webhook coalescing:\n")
+    passed = 0
+    failed = 0
+
+    server = WebhookServer()
+    enable_webhook(server.url)
+    project_dir = Path(tempfile.mkdtemp())
+    try:
+        write_features(project_dir, make_features(10, 0))
+        progress.print_progress_summary(project_dir)
+
+        # Hold the first send so the next updates wait in the queue
+        server.release.clear()
+        write_features(project_dir, make_features(10, 2))
+        progress.print_progress_summary(project_dir)
+        server.received.wait(5)
+        server.received.clear()
+
+        write_features(project_dir, make_features(10, 4))
+        progress.print_progress_summary(project_dir)
+        write_features(project_dir, make_features(10, 7))
+        progress.print_progress_summary(project_dir)
+
+        server.release.set()
+        server.wait_for(2)
+    finally:
+        server.release.set()
+        disable_notifiers()
+
+    payloads = [p[0] for p in server.payloads]
+    if check("two POSTs for three updates", len(payloads) == 2, f"Got: {len(payloads)}"):
+        passed += 1
+    else:
+        failed += 1
+
+    if len(payloads) == 2:
+        first, merged = payloads
+        ok = (first["previous_passing"], first["passing"]) == (0, 2)
+        if check("first POST covers 0 -> 2", ok, f"Got: {first}"):
+            passed += 1
+        else:
+            failed += 1
+
+        expected = [f"[c{i % 3}] feature {i}" for i in range(2, 7)]
+        ok = (
+            (merged["previous_passing"], merged["passing"]) == (2, 7)
+            and merged["tests_completed_this_session"] == 5
+            and merged["completed_tests"] == expected
+        )
+        if check("merged POST covers 2 -> 7 with all completed tests", ok, f"Got: {merged}"):
+            passed += 1
+        else:
+            failed += 1
+
+    return passed, failed
+
+
+def test_high_water_mark():
+    """Test that dropping progress keeps the highest count in the cache."""
+    print("\nTesting progress high-water mark:\n")
+    passed = 0
+    failed = 0
+
+    server = WebhookServer()
+    enable_webhook(server.url)
+    project_dir = Path(tempfile.mkdtemp())
+    cache_file = project_dir / progress.PROGRESS_CACHE_FILE
+    try:
+        write_features(project_dir, make_features(10, 5))
+        progress.print_progress_summary(project_dir)
+        server.wait_for(1)
+
+        # Progress drops: the higher count is flushed and kept
+        write_features(project_dir, make_features(10, 3))
+        progress.print_progress_summary(project_dir)
+        count = json.loads(cache_file.read_text())["count"]
+        if check("cache keeps count 5 after dropping to 3", count == 5, f"Got: {count}"):
+            passed += 1
+        else:
+            failed += 1
+
+        # Recovering to the old high-water mark is not new progress
+        write_features(project_dir, make_features(10, 5))
+        progress.print_progress_summary(project_dir)
+        server.wait_for(1)
+        if check("no notification when returning to 5", len(server.payloads) == 1, f"Got: {len(server.payloads)}"):
+            passed += 1
+        else:
+            failed += 1
+
+        write_features(project_dir, make_features(10, 6))
+        progress.print_progress_summary(project_dir)
+        server.wait_for(2)
+    finally:
+        disable_notifiers()
+
+    last = server.payloads[-1][0]
+    ok = len(server.payloads) == 2 and last["previous_passing"] == 5 and last["completed_tests"] == ["[c2] feature 5"]
+    if check("passing 6 reports only the new test", ok, f"Got: {last}"):
+        passed += 1
+    else:
+        failed += 1
+
+    # Without a notifier the cache still keeps the high-water mark
+    project_dir = Path(tempfile.mkdtemp())
+    cache_file = project_dir / progress.PROGRESS_CACHE_FILE
+    write_features(project_dir, make_features(10, 0))
+    progress.print_progress_summary(project_dir)
+    ok = cache_file.exists()
+    if check("no notifier: initial cache written", ok):
+        passed += 1
+    else:
+        failed += 1
+
+    write_features(project_dir, make_features(10, 5))
+    progress.print_progress_summary(project_dir)
+    write_features(project_dir, make_features(10, 3))
+    progress.print_progress_summary(project_dir)
+    progress._flush_all()
+    result = progress._read_progress_file(cache_file)
+    if check("no notifier: cache keeps 5 after dropping to 3", result == (5, 0b11111), f"Got: {result}"):
+        passed += 1
+    else:
+        failed += 1
+
+    write_features(project_dir, make_features(10, 6))
+    progress.print_progress_summary(project_dir)
+    progress._flush_all()
+    result = progress._read_progress_file(cache_file)
+    if check("no notifier: cache advances to 6", result == (6, 0b111111), f"Got: {result}"):
+        passed += 1
+    else:
+        failed += 1
+
+    return passed, failed
+
+
+def test_crash_cases():
+    """Test inputs that must not stop the agent."""
+    print("\nTesting inputs that must not crash:\n")
+    passed = 0
+    failed = 0
+
+    # Malformed webhook URLs disable the notifier instead of failing import
+    for url in ("http://host:abc/hook", "https://[bad/hook", "http:///hook"):
+        env = {**os.environ, "PROGRESS_N8N_WEBHOOK_URL": url}
+        result = subprocess.run(
+            [sys.executable, "-c", "import progress; print(progress._NOTIFY_ENABLED)"],
+            capture_output=True, text=True, env=env, cwd=Path(__file__).parent,
+        )
+        ok = result.returncode == 0 and result.stdout.strip().endswith("False")
+        if check(f"import with webhook URL {url!r}", ok, result.stderr.strip()):
+            passed += 1
+        else:
+            failed += 1
+
+    server = WebhookServer()
+    enable_webhook(server.url)
+    try:
+        # Non-string category
+        project_dir = Path(tempfile.mkdtemp())
+        (project_dir / progress.PROGRESS_CACHE_FILE).write_text(json.dumps({"count": 0, "passing_bits": ""}))
+        write_features(project_dir, [{"passes": True, "category": ["ui"], "description": "x"}])
+        try:
+            progress.print_progress_summary(project_dir)
+            server.wait_for(1)
+            completed = server.payloads[-1][0]["completed_tests"]
+            ok, detail = completed == ["[['ui']] x"], f"Got: {completed}"
+        except Exception as e:
+            ok, detail = False, f"raised {type(e).__name__}: {e}"
+        if check("non-string category", ok, detail):
+            passed += 1
+        else:
+            failed += 1
+
+        # Corrupt legacy caches, read through the concurrent prefetch
+        for indices in ([-1], [0, -3]):
+            project_dir = Path(tempfile.mkdtemp())
+            (project_dir / progress.PROGRESS_CACHE_FILE).write_text(
+                json.dumps({"count": 1, "passing_indices": indices})
+            )
+            write_features(project_dir, make_features(4, 1))
+            try:
+                progress.print_progress_summary(project_dir)
+                ok, detail = progress._progress_state[project_dir / progress.PROGRESS_CACHE_FILE] == (1, 1), ""
+            except Exception as e:
+                ok, detail = False, f"raised {type(e).__name__}: {e}"
+            if check(f"legacy cache with passing_indices {indices}", ok, detail):
+                passed += 1
+            else:
+                failed += 1
+        server.wait_for(len(server.payloads))
+
+        # A payload that can't be encoded is reported, and the worker keeps sending
+        sent = len(server.payloads)
+        progress._queue_progress_webhook({"completed_tests": [object()]})
+        wait_for_queue()
+        progress._queue_progress_webhook({"event": "after_bad_payload", "completed_tests": []})
+        server.wait_for(sent + 1)
+        ok = (
+            progress._notify_worker.is_alive()
+            and len(server.payloads) == sent + 1
+            and server.payloads[-1][0]["event"] == "after_bad_payload"
+        )
+        if check("worker still sends after an unencodable payload", ok, f"Got: {server.payloads[sent:]}"):
+            passed += 1
+        else:
+            failed += 1
+    finally:
+        disable_notifiers()
+
+    return passed, failed
+
+
+def main():
+    print("=" * 70)
+    print("  PROGRESS TRACKING TESTS")
+    print("=" * 70)
+
+    passed = 0
+    failed = 0
+
+    # Test legacy cache parsing
+    legacy_passed, legacy_failed = test_legacy_cache()
+    passed += legacy_passed
+    failed += legacy_failed
+
+    # Test bitset cache format
+    bits_passed, bits_failed = test_bitset_roundtrip()
+    passed += bits_passed
+    failed += bits_failed
+
+    # Test feature list formats
+    format_passed, format_failed = test_feature_formats()
+    passed += format_passed
+    failed += format_failed
+
+    # Test webhook coalescing
+    coalesce_passed, coalesce_failed = test_webhook_coalescing()
+    passed += coalesce_passed
+    failed += coalesce_failed
+
+    # Test high-water mark
+    hwm_passed, hwm_failed = test_high_water_mark()
+    passed += hwm_passed
+    failed += hwm_failed
+
+    # Test crash cases
+    crash_passed, crash_failed = test_crash_cases()
+    passed += crash_passed
+    failed += crash_failed
+
+    # Summary
+    print("\n" + "-" * 70)
+    print(f"  Results: {passed} passed, {failed} failed")
+    print("-" * 70)
+
+    if failed == 0:
+        print("\n  ALL TESTS PASSED")
+        return 0
+    else:
+        print(f"\n  {failed} TEST(S) FAILED")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())